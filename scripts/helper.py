@@ -12,15 +12,18 @@ Features:
 """
 
 import os
+import posixpath
 import sys
-import json
-import shutil
-import subprocess
+import time
 import argparse
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import zipfile
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
+
+# Heavier modules are imported by the commands that use them, so quick
+# commands like 'list' and 'info' start up without loading them
+if TYPE_CHECKING:
+    import subprocess
+    import zipfile
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -28,6 +31,69 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+# Prefer orjson when installed, it parses and serializes bytes directly
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Already compressed formats are stored as-is, deflating them again saves nothing
+STORED_SUFFIXES = {'.jar', '.class', '.zip', '.png', '.pdf'}
+# Fastest zlib level, source files still shrink to nearly the same size as at level 6
+DEFLATE_LEVEL = 1
+# Below this size mapping a file costs more than reading it through zipfile
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _write_lines(lines: List[str], end: str = '\n'):
+    """Write buffered output lines with a single call and empty the buffer"""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + end)
+        lines.clear()
+
+
+def _fast_copy(source_file: str, target_file: str):
+    """Copy file contents and metadata, letting the kernel move the data where possible"""
+    import errno
+    import shutil
+
+    if hasattr(os, 'copy_file_range'):
+        # Linux only, reflinks on Btrfs/XFS and never passes data through user space
+        try:
+            with open(source_file, 'rb') as src, open(target_file, 'wb') as dst:
+                # Copy until end of file rather than trusting the stat size,
+                # which is wrong for files that grow or for /proc entries
+                total = 0
+                while True:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30)
+                    if copied == 0:
+                        break
+                    total += copied
+            copied_all = total > 0
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            copied_all = False
+
+        if not copied_all:
+            shutil.copyfile(source_file, target_file)
+    else:
+        shutil.copyfile(source_file, target_file)
+
+    shutil.copystat(source_file, target_file)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -51,6 +117,20 @@ class Colors:
         Colors.BOLD = ''
 
 
+class AssignmentMetadata(dict):
+    """Assignment metadata keyed by assignment ID, remembering the sorted IDs"""
+    __slots__ = ('_sorted_ids',)
+
+    @property
+    def sorted_ids(self) -> Tuple[str, ...]:
+        """Assignment IDs in sorted order, computed on first use"""
+        try:
+            return self._sorted_ids
+        except AttributeError:
+            self._sorted_ids = tuple(sorted(self))
+            return self._sorted_ids
+
+
 class AssignmentHelper:
     """Main class for assignment helper functionality"""
 
@@ -61,96 +141,284 @@ class AssignmentHelper:
         self.metadata_file = self.scripts_dir / "assignment_metadata.json"
         self.output_dir = root_dir / "output"
 
+        # Resolved lazily by _find_git(), so commands that never touch Git pay nothing
+        self._git: Optional[str] = None
+        self._git_available: Optional[bool] = None
+        self._git_status_cache: Dict[str, Dict] = {}
+        self._git_layout: Optional[Tuple[str, Optional[Path]]] = None
+        self._commit_graph_checked = False
+
+        # Parsed JSON files keyed by path, stored with the (mtime_ns, size) they were read at
+        self._json_cache: Dict[Path, Tuple[int, int, Dict]] = {}
+
         # Check if stdout is a terminal
         if not sys.stdout.isatty():
             Colors.disable()
 
+        # Decorated atoms reused across commands, built once the colors are settled
+        self.OK = f"{Colors.GREEN}✓{Colors.RESET}"
+        self.FAIL = f"{Colors.RED}✗{Colors.RESET}"
+        self.SKIP = f"{Colors.YELLOW}→{Colors.RESET}"
+        self.SEP = "=" * 70
+        self.HSEP_G = f"{Colors.GREEN}{self.SEP}{Colors.RESET}"
+        self.HSEP_R = f"{Colors.RED}{self.SEP}{Colors.RESET}"
+
     def load_config(self) -> Dict:
         """Load user configuration"""
         if not self.config_file.exists():
             print(f"{Colors.YELLOW}⚠ Config file not found. Please run 'config' command first.{Colors.RESET}")
             sys.exit(1)
 
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._load_json(self.config_file)
 
     def save_config(self, config: Dict):
         """Save user configuration"""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        self.config_file.write_bytes(_dumps(config))
+        self._json_cache.pop(self.config_file, None)
 
-    def load_metadata(self) -> Dict:
+    def load_metadata(self) -> AssignmentMetadata:
         """Load assignment metadata"""
         if not self.metadata_file.exists():
             print(f"{Colors.RED}✗ Metadata file not found: {self.metadata_file}{Colors.RESET}")
             print(f"  Please ensure assignment_metadata.json exists in scripts/ directory")
             sys.exit(1)
 
-        with open(self.metadata_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._load_json(self.metadata_file, AssignmentMetadata)
+
+    def _load_json(self, path: Path, factory: Optional[Callable[[Dict], Dict]] = None) -> Dict:
+        """Parse a JSON file, reusing the previous result while the file is unchanged"""
+        stat = path.stat()
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        data = _loads(path.read_bytes())
+        if factory is not None:
+            data = factory(data)
+        self._json_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
 
     def get_assignment_dir(self, assignment: str) -> Path:
         """Get assignment directory path"""
         return self.root_dir / assignment / "tai-e"
 
-    def check_git_status(self, file_path: Path) -> Dict:
+    def _find_git(self) -> Optional[str]:
+        """Locate the git executable once and remember the result"""
+        if self._git_available is None:
+            import shutil
+            self._git = shutil.which('git')
+            self._git_available = self._git is not None
+        return self._git
+
+    def _run_git(self, args: List[str], timeout: float = 5) -> 'subprocess.CompletedProcess':
+        """Run git from the resolved absolute path without a shell or console window"""
+        import subprocess
+
+        # Only valid after _find_git() returned a path
+        return subprocess.run(
+            [self._git] + args,
+            cwd=self.root_dir,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=timeout,
+            close_fds=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+
+    def _find_git_layout(self) -> Tuple[str, Optional[Path]]:
+        """Get the root directory's path prefix inside its repository and the .git directory"""
+        # Git prints paths relative to the top level, which may lie above root_dir
+        if self._git_layout is None:
+            result = self._run_git(['rev-parse', '--show-prefix', '--git-dir'])
+            lines = result.stdout.splitlines()
+            if result.returncode == 0 and len(lines) == 2:
+                self._git_layout = (lines[0], self.root_dir / lines[1])
+            else:
+                # Not inside a repository
+                self._git_layout = ('', None)
+        return self._git_layout
+
+    def _ensure_commit_graph(self):
+        """Write a commit-graph with changed-path Bloom filters once per repository"""
+        # The filters let pathspec-limited 'git log' walks skip most commits.
+        # A stamp file under .git/ records that the graph has already been written.
+        if self._commit_graph_checked:
+            return
+        self._commit_graph_checked = True
+
+        import subprocess
+
+        try:
+            _, git_dir = self._find_git_layout()
+            if git_dir is None:
+                return
+            stamp = git_dir / "helper-commit-graph"
+            if stamp.exists():
+                return
+
+            result = self._run_git(['commit-graph', 'write', '--reachable', '--changed-paths'], timeout=30)
+            if result.returncode == 0:
+                stamp.touch()
+        except (subprocess.SubprocessError, OSError):
+            # The graph is only an optimization, the plain log walk still works
+            pass
+
+    def _last_commits(self, pathspecs: List[str], pending: Set[str]) -> Dict[str, Dict]:
+        """Find the last commit touching each pending path, stopping the walk once all are found"""
+        import subprocess
+        import threading
+
+        commits = {}
+        with subprocess.Popen(
+            [self._git, '-c', 'core.quotePath=false', 'log', '--name-status',
+             '--format=%x00%h|%cr|%s', '--'] + pathspecs,
+            cwd=self.root_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            close_fds=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        ) as proc:
+            # Same limit as the other git calls, a stuck walk is killed
+            timer = threading.Timer(5, proc.kill)
+            timer.start()
+            try:
+                commit = None
+                for line in proc.stdout:
+                    line = line.rstrip('\n')
+                    if line.startswith('\0'):
+                        parts = line[1:].split('|', 2)
+                        commit = parts if len(parts) == 3 else None
+                        continue
+
+                    rel_path = line.rsplit('\t', 1)[-1]
+                    if commit is not None and rel_path in pending:
+                        pending.discard(rel_path)
+                        commits[rel_path] = {
+                            'commit': commit[0],
+                            'time': commit[1],
+                            'message': commit[2]
+                        }
+                        if not pending:
+                            # Everything resolved, no need to walk the rest of the history
+                            proc.kill()
+                            break
+            finally:
+                timer.cancel()
+
+        return commits
+
+    def prepare_git_status(self, paths: List[Union[str, Path]]):
+        """Query Git status of several files at once for later check_git_status() calls"""
+        pending = [os.fspath(path) for path in paths if os.fspath(path) not in self._git_status_cache]
+        self._git_status_cache.update(self._batch_git_status(pending))
+
+    def check_git_status(self, file_path: Union[str, Path]) -> Dict:
         """Check Git status of a file"""
+        key = os.fspath(file_path)
+        if key not in self._git_status_cache:
+            self.prepare_git_status([key])
+        return self._git_status_cache[key]
+
+    def _batch_git_status(self, paths: List[str]) -> Dict[str, Dict]:
+        """Check Git status of several files with a fixed number of git calls"""
+        if not paths:
+            return {}
+
+        import subprocess
+
+        if self._find_git() is None:
+            # Git not available, fallback to file modification time
+            return self._mtime_statuses(paths)
+
+        root = os.fspath(self.root_dir)
+
         try:
-            # Check if file is modified
-            result = subprocess.run(
-                ['git', 'status', '--porcelain', str(file_path)],
-                cwd=self.root_dir,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            status = result.stdout.strip()
-
-            if not status:
-                return {'status': 'unmodified'}
-            elif status.startswith(' M') or status.startswith('M '):
-                # Get last commit info
-                log_result = subprocess.run(
-                    ['git', 'log', '-1', '--format=%h|%cr|%s', '--', str(file_path)],
-                    cwd=self.root_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
+            prefix, _ = self._find_git_layout()
+
+            # Pathspecs are relative to root_dir, output paths to the repository top level
+            pathspecs = {path: os.path.relpath(path, root).replace(os.sep, '/') for path in paths}
+            top_paths = {prefix + pathspec: path for path, pathspec in pathspecs.items()}
+
+            # Check which files are modified
+            result = self._run_git(['status', '--porcelain', '-z', '--'] + list(pathspecs.values()))
+        except FileNotFoundError:
+            # The resolved executable vanished, don't try it again
+            self._git = None
+            self._git_available = False
+            return self._mtime_statuses(paths)
+        except subprocess.SubprocessError:
+            # Git failed or timed out, fallback to file modification time
+            return self._mtime_statuses(paths)
+
+        statuses = {path: {'status': 'unmodified'} for path in paths}
+        modified = []
+
+        entries = iter(result.stdout.split('\0'))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            xy, top_path = entry[:2], entry[3:]
+            if xy[0] in 'RC':
+                # Renames and copies are followed by the original path
+                next(entries, None)
 
-                if log_result.stdout.strip():
-                    parts = log_result.stdout.strip().split('|', 2)
-                    if len(parts) == 3:
-                        return {
-                            'status': 'modified',
-                            'commit': parts[0],
-                            'time': parts[1],
-                            'message': parts[2]
-                        }
+            path = top_paths.get(top_path)
+            if path is None:
+                continue
 
-                return {'status': 'modified'}
-            elif status.startswith('??'):
-                return {'status': 'untracked'}
+            if xy in (' M', 'M '):
+                statuses[path] = {'status': 'modified'}
+                modified.append(path)
+            elif xy == '??':
+                statuses[path] = {'status': 'untracked'}
+            else:
+                statuses[path] = {'status': 'unknown'}
 
-            return {'status': 'unknown'}
+        if modified:
+            # Get last commit info of all modified files in one history walk, a failure
+            # only loses that info and keeps the statuses found above
+            try:
+                self._ensure_commit_graph()
+                commits = self._last_commits(
+                    [pathspecs[path] for path in modified],
+                    {prefix + pathspecs[path] for path in modified}
+                )
+            except (subprocess.SubprocessError, OSError):
+                commits = {}
 
-        except (subprocess.SubprocessError, FileNotFoundError):
-            # Git not available or not a git repo, fallback to file modification time
-            if file_path.exists():
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                days_ago = (datetime.now() - mtime).days
-                if days_ago == 0:
-                    time_str = "today"
-                elif days_ago == 1:
-                    time_str = "yesterday"
-                else:
-                    time_str = f"{days_ago} days ago"
+            for top_path, commit in commits.items():
+                statuses[top_paths[top_path]].update(commit)
 
-                return {'status': 'unknown', 'time': time_str}
+        return statuses
 
+    def _mtime_statuses(self, paths: List[str]) -> Dict[str, Dict]:
+        """Describe several files by their modification times when Git is unavailable"""
+        now_ts = time.time()
+        return {path: self._mtime_status(path, now_ts) for path in paths}
+
+    @staticmethod
+    def _mtime_status(file_path: str, now_ts: float) -> Dict:
+        """Describe a file by its modification time relative to now_ts"""
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
             return {'status': 'unknown'}
 
+        days_ago = int((now_ts - mtime) // 86400)
+        if days_ago == 0:
+            time_str = "today"
+        elif days_ago == 1:
+            time_str = "yesterday"
+        else:
+            time_str = f"{days_ago} days ago"
+
+        return {'status': 'unknown', 'time': time_str}
+
     def cmd_config(self, args):
         """Configure student ID and name"""
         print(f"{Colors.BOLD}Assignment Helper Configuration{Colors.RESET}")
@@ -159,8 +427,7 @@ class AssignmentHelper:
         # Load existing config if available
         existing_config = {}
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                existing_config = json.load(f)
+            existing_config = self._load_json(self.config_file)
 
         # Get student ID
         default_id = existing_config.get('student_id', '')
@@ -195,21 +462,22 @@ class AssignmentHelper:
         """List all assignments"""
         metadata = self.load_metadata()
 
-        print(f"\n{Colors.BOLD}Available Assignments{Colors.RESET}")
-        print("=" * 70)
+        lines = [f"\n{Colors.BOLD}Available Assignments{Colors.RESET}", self.SEP]
 
-        for assignment_id in sorted(metadata.keys()):
+        for assignment_id in metadata.sorted_ids:
             info = metadata[assignment_id]
             dep_count = len(info.get('dependencies', []))
             file_count = len(info.get('files_to_submit', []))
 
-            print(f"\n{Colors.CYAN}{assignment_id}{Colors.RESET}: {info['name']}")
-            print(f"  Files to submit: {file_count}")
-            print(f"  Dependencies: {dep_count} file(s) from previous assignments")
+            lines.append(f"\n{Colors.CYAN}{assignment_id}{Colors.RESET}: {info['name']}")
+            lines.append(f"  Files to submit: {file_count}")
+            lines.append(f"  Dependencies: {dep_count} file(s) from previous assignments")
 
             if dep_count > 0:
                 deps_from = set(dep['from'] for dep in info['dependencies'])
-                print(f"  Depends on: {', '.join(sorted(deps_from))}")
+                lines.append(f"  Depends on: {', '.join(sorted(deps_from))}")
+
+        _write_lines(lines)
 
     def cmd_info(self, args):
         """Show detailed information about an assignment"""
@@ -218,13 +486,13 @@ class AssignmentHelper:
 
         if assignment not in metadata:
             print(f"{Colors.RED}✗ Invalid assignment: {assignment}{Colors.RESET}")
-            print(f"  Valid assignments: {', '.join(sorted(metadata.keys()))}")
+            print(f"  Valid assignments: {', '.join(metadata.sorted_ids)}")
             sys.exit(1)
 
         info = metadata[assignment]
 
         print(f"\n{Colors.BOLD}Assignment {assignment}: {info['name']}{Colors.RESET}")
-        print("=" * 70)
+        print(self.SEP)
 
         # Files to submit
         print(f"\n{Colors.CYAN}Files to Submit:{Colors.RESET}")
@@ -247,6 +515,7 @@ class AssignmentHelper:
 
         if assignment not in metadata:
             print(f"{Colors.RED}✗ Invalid assignment: {assignment}{Colors.RESET}")
+            print(f"  Valid assignments: {', '.join(metadata.sorted_ids)}")
             sys.exit(1)
 
         info = metadata[assignment]
@@ -257,91 +526,187 @@ class AssignmentHelper:
             return
 
         print(f"\n{Colors.BOLD}Setting up dependencies for {assignment}...{Colors.RESET}")
-        print("=" * 70)
+        print(self.SEP)
+
+        # Plain string paths keep the per-file joins and system calls cheap
+        adir_s = os.fspath(self.get_assignment_dir(assignment))
+        source_dirs = {dep['from']: os.fspath(self.get_assignment_dir(dep['from'])) for dep in deps}
+
+        # Targets identical to their source need neither Git nor a copy,
+        # query Git once for all the remaining ones instead of once per file
+        up_to_date = set()
+        existing_targets = []
+        for dep in deps:
+            target_file = os.path.join(adir_s, dep['file'])
+            if not os.path.exists(target_file):
+                continue
+            source_file = os.path.join(source_dirs[dep['from']], dep['file'])
+            if self._has_same_content(source_file, target_file):
+                up_to_date.add(target_file)
+            else:
+                existing_targets.append(target_file)
+        self.prepare_git_status(existing_targets)
 
-        target_dir = self.get_assignment_dir(assignment)
         success_count = 0
         skip_count = 0
+        up_to_date_count = 0
         force_all = args.force
+        copies = []
 
-        for idx, dep in enumerate(deps, 1):
-            source_assignment = dep['from']
-            file_rel_path = dep['file']
-
-            source_dir = self.get_assignment_dir(source_assignment)
-            source_file = source_dir / file_rel_path
-            target_file = target_dir / file_rel_path
-
-            # Print header
-            print(f"\n[{idx}/{len(deps)}] {os.path.basename(file_rel_path)}")
-            print(f"  {source_assignment} → {assignment}")
-            print()
-
-            # Check source file exists
-            if not source_file.exists():
-                print(f"  Status: {Colors.RED}✗ Source file not found{Colors.RESET}")
-                continue
+        # Quitting or failing partway still copies the files accepted so far
+        cancelled = False
+        pending_error = None
+        try:
+            for idx, dep in enumerate(deps, 1):
+                source_assignment = dep['from']
+                file_rel_path = dep['file']
+
+                source_file = os.path.join(source_dirs[source_assignment], file_rel_path)
+                target_file = os.path.join(adir_s, file_rel_path)
+
+                # Print header, each file's output is written in one go
+                lines = [
+                    f"\n[{idx}/{len(deps)}] {os.path.basename(file_rel_path)}",
+                    f"  {source_assignment} → {assignment}",
+                    ''
+                ]
+
+                # Check source file exists
+                if not os.path.exists(source_file):
+                    lines.append(f"  Status: {Colors.RED}✗ Source file not found{Colors.RESET}")
+                    _write_lines(lines)
+                    continue
 
-            # Determine target file status
-            target_exists = target_file.exists()
-            git_status = self.check_git_status(target_file) if target_exists else None
-            is_modified = git_status and git_status.get('status') == 'modified'
-
-            # Display status
-            if not target_exists:
-                print(f"  Status: ℹ Target file does not exist")
-            elif is_modified:
-                time_str = git_status.get('time', 'recently')
-                print(f"  Status: 📝 Target file modified {time_str}")
-            else:
-                print(f"  Status: ✓ Target file unchanged")
-
-            # Handle modified files (need confirmation)
-            if is_modified and not force_all:
-                print(f"  {Colors.YELLOW}⚠ This will overwrite your local changes.{Colors.RESET}")
-                print(f"  Options:")
-                print(f"    y - Yes, overwrite this file")
-                print(f"    n - No, skip this file")
-                print(f"    a - All, overwrite this and all remaining files")
-                print(f"    q - Quit setup")
-                print(f"  Your choice [y/N/a/q]: ", end='')
-                choice = input().lower().strip()
-
-                if choice == 'q':
-                    print(f"\n{Colors.YELLOW}Setup cancelled by user{Colors.RESET}")
-                    sys.exit(0)
-                elif choice == 'a':
-                    force_all = True
-                    print()
-                elif choice != 'y':
-                    print(f"  {Colors.YELLOW}→ Skipped{Colors.RESET}")
-                    skip_count += 1
+                if target_file in up_to_date:
+                    lines.append(f"  Status: ✓ Target file already up to date")
+                    up_to_date_count += 1
+                    _write_lines(lines)
                     continue
-                else:
-                    print()
 
-            # Perform copy
-            try:
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_file, target_file)
+                # Determine target file status
+                target_exists = os.path.exists(target_file)
+                git_status = self.check_git_status(target_file) if target_exists else None
+                is_modified = git_status and git_status.get('status') == 'modified'
+
+                # Display status
+                if not target_exists:
+                    lines.append(f"  Status: ℹ Target file does not exist")
+                elif is_modified:
+                    time_str = git_status.get('time', 'recently')
+                    lines.append(f"  Status: 📝 Target file modified {time_str}")
+                else:
+                    lines.append(f"  Status: ✓ Target file unchanged")
+
+                # Handle modified files (need confirmation)
+                if is_modified and not force_all:
+                    lines.append(f"  {Colors.YELLOW}⚠ This will overwrite your local changes.{Colors.RESET}")
+                    lines.append(f"  Options:")
+                    lines.append(f"    y - Yes, overwrite this file")
+                    lines.append(f"    n - No, skip this file")
+                    lines.append(f"    a - All, overwrite this and all remaining files")
+                    lines.append(f"    q - Quit setup")
+                    lines.append(f"  Your choice [y/N/a/q]: ")
+                    _write_lines(lines, end='')
+                    choice = input().lower().strip()
+
+                    if choice == 'q':
+                        cancelled = True
+                        break
+                    elif choice == 'a':
+                        force_all = True
+                        lines.append('')
+                    elif choice != 'y':
+                        lines.append(f"  {Colors.YELLOW}→ Skipped{Colors.RESET}")
+                        skip_count += 1
+                        _write_lines(lines)
+                        continue
+                    else:
+                        lines.append('')
+
+                # Copy later, together with the other accepted files
+                copies.append((idx, source_file, target_file, is_modified and force_all))
+                _write_lines(lines)
+        except BaseException as e:
+            pending_error = e
+
+        # Perform copies concurrently, the per-file cost is mostly I/O latency
+        if copies:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            lines = [f"\nCopying {len(copies)} file(s)..."]
+
+            # Create each target directory once, dependencies often share one
+            created_dirs = set()
+            for _, _, target_file, _ in copies:
+                parent = os.path.dirname(target_file)
+                if parent in created_dirs:
+                    continue
+                try:
+                    os.makedirs(parent, exist_ok=True)
+                except OSError:
+                    # The copy itself fails and reports the error for this file
+                    continue
+                while parent not in created_dirs:
+                    created_dirs.add(parent)
+                    parent = os.path.dirname(parent)
+
+            results = []
+            with ThreadPoolExecutor(max_workers=min(8, len(copies))) as executor:
+                futures = {
+                    executor.submit(_fast_copy, source_file, target_file): (idx, target_file, overwrote)
+                    for idx, source_file, target_file, overwrote in copies
+                }
+                for future in as_completed(futures):
+                    idx, target_file, overwrote = futures[future]
+                    results.append((idx, os.path.basename(target_file), overwrote, future.exception()))
+
+            for idx, name, overwrote, error in sorted(results, key=lambda result: result[0]):
+                if error is not None:
+                    lines.append(f"  [{idx}/{len(deps)}] {name}: {Colors.RED}✗ Failed: {str(error)}{Colors.RESET}")
+                    continue
 
-                if is_modified and force_all:
-                    print(f"  {Colors.GREEN}✓ Copied (overwrote local changes){Colors.RESET}")
+                if overwrote:
+                    lines.append(f"  [{idx}/{len(deps)}] {name}: {Colors.GREEN}✓ Copied (overwrote local changes){Colors.RESET}")
                 else:
-                    print(f"  {Colors.GREEN}✓ Copied{Colors.RESET}")
+                    lines.append(f"  [{idx}/{len(deps)}] {name}: {Colors.GREEN}✓ Copied{Colors.RESET}")
 
                 success_count += 1
-            except Exception as e:
-                print(f"  {Colors.RED}✗ Failed: {str(e)}{Colors.RESET}")
+
+            _write_lines(lines)
+
+        if pending_error is not None:
+            raise pending_error
+        if cancelled:
+            print(f"\n{Colors.YELLOW}Setup cancelled by user{Colors.RESET}")
+            sys.exit(0)
 
         # Summary
-        print(f"\n{Colors.BOLD}Summary:{Colors.RESET}")
-        print(f"  {Colors.GREEN}✓{Colors.RESET} Copied: {success_count}")
+        lines = [
+            f"\n{Colors.BOLD}Summary:{Colors.RESET}",
+            f"  {self.OK} Copied: {success_count}"
+        ]
+        if up_to_date_count > 0:
+            lines.append(f"  {self.OK} Up to date: {up_to_date_count}")
         if skip_count > 0:
-            print(f"  {Colors.YELLOW}→{Colors.RESET} Skipped: {skip_count}")
+            lines.append(f"  {self.SKIP} Skipped: {skip_count}")
+        _write_lines(lines)
+
+    @staticmethod
+    def _has_same_content(source_file: str, target_file: str) -> bool:
+        """Check whether the target file already matches the source byte for byte"""
+        try:
+            if os.path.getsize(source_file) != os.path.getsize(target_file):
+                return False
+            with open(source_file, 'rb') as src, open(target_file, 'rb') as dst:
+                return src.read() == dst.read()
+        except OSError:
+            return False
 
-    def cmd_test(self, args):
+    def cmd_test(self, args, while_running: Optional[Callable[[], None]] = None):
         """Run tests for an assignment"""
+        import subprocess
+        from collections import deque
+
         assignment = args.assignment
         assignment_dir = self.get_assignment_dir(assignment)
 
@@ -350,7 +715,7 @@ class AssignmentHelper:
             sys.exit(1)
 
         print(f"\n{Colors.BOLD}Running tests for {assignment}...{Colors.RESET}")
-        print("=" * 70)
+        print(self.SEP)
 
         # Determine gradle wrapper command
         if os.name == 'nt':  # Windows
@@ -369,35 +734,57 @@ class AssignmentHelper:
         print(f"Working directory: {assignment_dir}\n")
 
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=assignment_dir,
-                capture_output=not args.verbose,
-                text=True
-            )
+            tail = deque(maxlen=30)
+            if args.verbose:
+                output = {}
+            else:
+                # Keep only the last lines in memory, however long the build output is
+                output = {
+                    'stdout': subprocess.PIPE,
+                    'stderr': subprocess.STDOUT,
+                    'text': True,
+                    'errors': 'replace',
+                    'bufsize': 1
+                }
+
+            worker = None
+            with subprocess.Popen(cmd, cwd=assignment_dir, **output) as proc:
+                try:
+                    # Work that doesn't depend on the test outcome overlaps with the build,
+                    # on its own thread so the output pipe keeps draining meanwhile
+                    if while_running is not None:
+                        import threading
+                        worker = threading.Thread(target=while_running)
+                        worker.start()
+                    if proc.stdout is not None:
+                        for line in proc.stdout:
+                            tail.append(line.rstrip('\n'))
+                finally:
+                    if worker is not None:
+                        worker.join()
+            returncode = proc.returncode
 
             # Parse results
             test_report = assignment_dir / "build" / "reports" / "tests" / "test" / "index.html"
 
-            if result.returncode == 0:
-                print(f"\n{Colors.GREEN}{'=' * 70}{Colors.RESET}")
+            if returncode == 0:
+                print(f"\n{self.HSEP_G}")
                 print(f"{Colors.GREEN}✓ BUILD SUCCESSFUL{Colors.RESET}")
-                print(f"{Colors.GREEN}{'=' * 70}{Colors.RESET}")
+                print(self.HSEP_G)
 
                 if test_report.exists():
                     print(f"\nDetailed report: {test_report}")
 
                 return True
             else:
-                print(f"\n{Colors.RED}{'=' * 70}{Colors.RESET}")
+                print(f"\n{self.HSEP_R}")
                 print(f"{Colors.RED}✗ BUILD FAILED{Colors.RESET}")
-                print(f"{Colors.RED}{'=' * 70}{Colors.RESET}")
+                print(self.HSEP_R)
 
-                if not args.verbose and result.stdout:
+                if tail:
                     # Show last 30 lines of output
-                    lines = result.stdout.split('\n')
                     print("\nLast lines of output:")
-                    print('\n'.join(lines[-30:]))
+                    print('\n'.join(tail))
 
                 if test_report.exists():
                     print(f"\nDetailed report: {test_report}")
@@ -419,45 +806,67 @@ class AssignmentHelper:
             sys.exit(1)
 
         info = metadata[assignment]
-        student_id = config['student_id']
-        student_name = config['student_name']
 
         print(f"\n{Colors.BOLD}Packaging {assignment} for submission...{Colors.RESET}")
-        print("=" * 70)
+        print(self.SEP)
 
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
 
         # Collect files
+        files_to_package, missing_files, lines = self._collect_submission(assignment, info)
+        _write_lines(lines)
+
+        if missing_files:
+            print(f"\n{Colors.RED}✗ Cannot package: {len(missing_files)} file(s) missing{Colors.RESET}")
+            sys.exit(1)
+
+        # Create ZIP file
+        zip_path = self._package_path(config, assignment)
+
+        print(f"\nCreating archive: {zip_path.name}")
+
+        self._write_archive(zip_path, files_to_package)
+        self._report_package(zip_path, len(files_to_package))
+
+    def _package_path(self, config: Dict, assignment: str) -> Path:
+        """Get the path of the submission archive for an assignment"""
+        return self.output_dir / f"{config['student_id']}-{config['student_name']}-{assignment}.zip"
+
+    def _collect_submission(self, assignment: str,
+                            info: Dict) -> Tuple[List[Tuple[Path, str, int]], List[str], List[str]]:
+        """Find the files to submit, returning them with the missing ones and checklist lines"""
         assignment_dir = self.get_assignment_dir(assignment)
         files_to_package = []
         missing_files = []
 
+        file_index = self._index_assignment_files(assignment_dir, info['files_to_submit'])
+
+        lines = []
         for file_rel_path in info['files_to_submit']:
             source_file = assignment_dir / file_rel_path
-            if source_file.exists():
-                files_to_package.append((source_file, file_rel_path))
-                print(f"{Colors.GREEN}✓{Colors.RESET} {os.path.basename(file_rel_path)}")
+            if file_rel_path in file_index:
+                files_to_package.append((source_file, file_rel_path, source_file.stat().st_size))
+                lines.append(f"{self.OK} {os.path.basename(file_rel_path)}")
             else:
                 missing_files.append(file_rel_path)
-                print(f"{Colors.RED}✗{Colors.RESET} {os.path.basename(file_rel_path)} (not found)")
-
-        if missing_files:
-            print(f"\n{Colors.RED}✗ Cannot package: {len(missing_files)} file(s) missing{Colors.RESET}")
-            sys.exit(1)
+                lines.append(f"{self.FAIL} {os.path.basename(file_rel_path)} (not found)")
 
-        # Create ZIP file
-        zip_filename = f"{student_id}-{student_name}-{assignment}.zip"
-        zip_path = self.output_dir / zip_filename
+        return files_to_package, missing_files, lines
 
-        print(f"\nCreating archive: {zip_filename}")
+    def _write_archive(self, zip_path: Path, files_to_package: List[Tuple[Path, str, int]]):
+        """Write the collected files into a ZIP archive"""
+        import zipfile
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for source_file, arcname in files_to_package:
+        total_size = sum(size for _, _, size in files_to_package)
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                             allowZip64=total_size >= zipfile.ZIP64_LIMIT) as zipf:
+            for source_file, arcname, size in files_to_package:
                 # Put files in root directory, using only filename
-                zip_arcname = os.path.basename(arcname)
-                zipf.write(source_file, zip_arcname)
+                self._write_zip_entry(zipf, source_file, os.path.basename(arcname), size)
 
+    def _report_package(self, zip_path: Path, file_count: int):
+        """Print the summary of a created package"""
         # Get file size
         file_size = zip_path.stat().st_size
         if file_size < 1024:
@@ -467,29 +876,115 @@ class AssignmentHelper:
         else:
             size_str = f"{file_size / (1024 * 1024):.1f} MB"
 
-        print(f"\n{Colors.GREEN}{'=' * 70}{Colors.RESET}")
+        print(f"\n{self.HSEP_G}")
         print(f"{Colors.GREEN}✓ Package created successfully{Colors.RESET}")
-        print(f"{Colors.GREEN}{'=' * 70}{Colors.RESET}")
+        print(self.HSEP_G)
         print(f"\nFile: {zip_path}")
         print(f"Size: {size_str}")
-        print(f"Files: {len(files_to_package)}")
+        print(f"Files: {file_count}")
+
+    @staticmethod
+    def _index_assignment_files(assignment_dir: Path, rel_paths: List[str]) -> Set[str]:
+        """Collect the existing files among the directories of the given paths"""
+        # One directory listing per distinct parent instead of one stat per file
+        file_index = set()
+        for rel_dir in {posixpath.dirname(rel_path) for rel_path in rel_paths}:
+            try:
+                with os.scandir(assignment_dir / rel_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            file_index.add(posixpath.join(rel_dir, entry.name))
+            except OSError:
+                # Missing directory, its files are reported as not found
+                continue
+        return file_index
+
+    @staticmethod
+    def _write_zip_entry(zipf: 'zipfile.ZipFile', source_file: Path, arcname: str, size: int):
+        """Add a file to the archive, compressing only formats that benefit from it"""
+        import mmap
+        import zipfile
+
+        if source_file.suffix.lower() in STORED_SUFFIXES:
+            compress_type, compresslevel = zipfile.ZIP_STORED, None
+        else:
+            compress_type, compresslevel = zipfile.ZIP_DEFLATED, DEFLATE_LEVEL
+
+        if size < MMAP_THRESHOLD:
+            zipf.write(source_file, arcname, compress_type=compress_type, compresslevel=compresslevel)
+            return
+
+        # Large files are checksummed and compressed straight from a memory map
+        zinfo = zipfile.ZipInfo.from_file(source_file, arcname)
+        with open(source_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as data:
+            zipf.writestr(zinfo, data, compress_type=compress_type, compresslevel=compresslevel)
 
     def cmd_submit(self, args):
         """Run tests and package if successful"""
-        print(f"{Colors.BOLD}Submitting {args.assignment}...{Colors.RESET}")
-        print("=" * 70)
-
-        # Run tests first
-        test_success = self.cmd_test(args)
+        # Load once for the whole submission, failing before the test run if unusable
+        config = self.load_config()
+        metadata = self.load_metadata()
 
-        if not test_success:
-            print(f"\n{Colors.RED}✗ Tests failed. Cannot package for submission.{Colors.RESET}")
-            print(f"  Fix the failing tests and try again.")
+        if args.assignment not in metadata:
+            print(f"{Colors.RED}✗ Invalid assignment: {args.assignment}{Colors.RESET}")
             sys.exit(1)
 
-        # Package files
-        print(f"\n{Colors.BOLD}Tests passed! Proceeding with packaging...{Colors.RESET}\n")
-        self.cmd_package(args)
+        assignment = args.assignment
+        info = metadata[assignment]
+        zip_path = self._package_path(config, assignment)
+
+        print(f"{Colors.BOLD}Submitting {assignment}...{Colors.RESET}")
+        print(self.SEP)
+
+        # Build the archive under a temporary name while Gradle runs, it is
+        # only renamed into place once the tests pass
+        prepared = {}
+
+        def prepare_package():
+            try:
+                files_to_package, missing_files, lines = self._collect_submission(assignment, info)
+                prepared.update(files=files_to_package, missing=missing_files, lines=lines)
+                if missing_files:
+                    return
+
+                self.output_dir.mkdir(exist_ok=True)
+                prepared['temp_path'] = zip_path.with_name(f".{zip_path.name}.part")
+                self._write_archive(prepared['temp_path'], files_to_package)
+            except Exception as e:
+                prepared['error'] = e
+
+        try:
+            # Run tests first
+            test_success = self.cmd_test(args, while_running=prepare_package)
+
+            if not test_success:
+                print(f"\n{Colors.RED}✗ Tests failed. Cannot package for submission.{Colors.RESET}")
+                print(f"  Fix the failing tests and try again.")
+                sys.exit(1)
+
+            # Package files
+            print(f"\n{Colors.BOLD}Tests passed! Proceeding with packaging...{Colors.RESET}\n")
+            print(f"\n{Colors.BOLD}Packaging {assignment} for submission...{Colors.RESET}")
+            print(self.SEP)
+
+            if 'error' in prepared:
+                raise prepared['error']
+
+            _write_lines(prepared['lines'])
+            if prepared['missing']:
+                print(f"\n{Colors.RED}✗ Cannot package: {len(prepared['missing'])} file(s) missing{Colors.RESET}")
+                sys.exit(1)
+
+            print(f"\nCreating archive: {zip_path.name}")
+            os.replace(prepared.pop('temp_path'), zip_path)
+            self._report_package(zip_path, len(prepared['files']))
+        finally:
+            # Tests failed or were interrupted, drop the partial archive
+            temp_path = prepared.get('temp_path')
+            if temp_path is not None and temp_path.exists():
+                temp_path.unlink()
 
 
 def main():